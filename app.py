@@ -7,10 +7,14 @@ Aplicación Flask para automatizar la configuración de un switch Cisco:
 - Lectura de VLANs actuales (show vlan brief)
 - Ignora VLANs 1002–1005 (FDDI/TokenRing)
 - Lectura y cambio de hostname
+- Lectura de VLANs, hostname, versión e interfaces en una sola conexión,
+  enviando los comandos en pipeline (con fallback a modo secuencial)
 - Aplicación de VLANs + hostname (configuration mode)
 - Write memory (save_config)
 - Descarga de running-config como archivo .txt
 - Envío de running-config a un servidor TFTP (copy run tftp:)
+- Carga masiva de VLANs por rangos (100-199:PREFIX_{id}) o archivo CSV,
+  con la tabla de VLANs paginada en el formulario
 - Regla de negocio: los nombres de VLAN no pueden tener más de 20 caracteres
 """
 
@@ -21,8 +25,12 @@ from netmiko import (
     NetmikoAuthenticationException,
 )
 from datetime import datetime
+import csv
+import io
+import itertools
 import re
-import time  # usado para pausar entre envíos en el copy run tftp
+import time  # usado para pausar entre envíos (copy run tftp / pipeline)
+import uuid
 
 
 ###############################################################################
@@ -37,6 +45,269 @@ app.secret_key = "cambia-esta-clave-para-tu-lab"
 # VLANs "legacy" que aparecen siempre y no queremos tocar
 IGNORE_VLANS = {"1002", "1003", "1004", "1005"}
 
+# Comandos que se leen juntos al presionar "Obtener VLANs y Hostname actuales"
+FACT_COMMANDS = [
+    "show vlan brief",
+    "show running-config | include ^hostname",
+    "show version",
+    "show interfaces status",
+]
+
+# Equipos (host, puerto) donde el modo pipeline falló: ahí vamos directo a secuencial
+PIPELINE_UNSUPPORTED = set()
+
+# Equipos (host, puerto) donde el pipeline se quedó sin tiempo → momento del timeout.
+# Durante PIPELINE_RETRY_SECONDS se usa secuencial sin esperar otro timeout.
+PIPELINE_TIMEOUTS = {}
+PIPELINE_RETRY_SECONDS = 600
+
+# Rango válido de VLAN IDs y cantidad de filas de VLAN que se muestran por página
+MAX_VLAN_ID = 4094
+VLANS_PER_PAGE = 50
+
+# Cantidad máxima de líneas (rangos) que se muestran en el resumen de VLANs
+VLAN_SUMMARY_LINES = 20
+
+# VLANs del formulario guardadas en el servidor: id de la sesión → VlanTable.
+# Así cada página solo viaja con sus filas; se guardan las últimas VLAN_STORE_MAX sesiones.
+VLAN_STORE = {}
+VLAN_STORE_MAX = 100
+
+
+###############################################################################
+# REPRESENTACIÓN COMPACTA DE VLANs (RANGOS / CSV / PAGINADO)
+###############################################################################
+
+def clean_vlan_name(name):
+    """
+    Quita caracteres de control y separadores de línea (\x85, \u2028, etc.)
+    del nombre de VLAN: IOS no los acepta y romperían el formato por líneas.
+    """
+    return re.sub(r"[\x00-\x1f\x7f-\x9f\u2028\u2029]", "", name).strip()
+
+
+def escape_vlan_name(name):
+    """
+    Escapa las llaves de un nombre de VLAN ({ → {{, } → }}) para que un
+    "{id}" literal en el nombre no se confunda con el comodín de los rangos.
+    """
+    return name.replace("{", "{{").replace("}", "}}")
+
+
+def expand_vlan_name(template, vlan_id):
+    """
+    Inverso de escape_vlan_name: reemplaza {id} por el VLAN ID y
+    {{ / }} por llaves literales.
+    """
+    return re.sub(
+        r"\{\{|\}\}|\{id\}",
+        lambda m: {"{{": "{", "}}": "}"}.get(m.group(), str(vlan_id)),
+        template,
+    )
+
+
+class VlanTable:
+    """
+    Conjunto de VLANs guardado en una lista indexada por VLAN ID
+    (posición = ID, valor = nombre o None), en lugar de una lista de dicts.
+
+    - Agregar / pisar una VLAN es O(1) y no hay duplicados
+    - Recorrerla devuelve las VLANs ya ordenadas por ID
+    - Al iterar se generan dicts {"id": "10", "name": "USERS"}, igual que
+      parse_vlans_from_show, así apply_config y el template no cambian
+    """
+
+    def __init__(self, vlans=()):
+        self._names = [None] * (MAX_VLAN_ID + 1)
+        self._count = 0
+        for vlan in vlans:
+            self.set(vlan["id"], vlan["name"])
+
+    def set(self, vlan_id, name):
+        """
+        Agrega o actualiza una VLAN aplicando las mismas reglas que el formulario:
+
+        - IDs fuera de 1–4094 o en IGNORE_VLANS se ignoran
+        - Se quitan caracteres de control (clean_vlan_name)
+        - Nombre vacío → VLAN_<id>
+        - Máximo 20 caracteres en el nombre
+        """
+        vlan_id = int(vlan_id)
+        if not 1 <= vlan_id <= MAX_VLAN_ID or str(vlan_id) in IGNORE_VLANS:
+            return
+
+        name = clean_vlan_name(name) or f"VLAN_{vlan_id}"
+        if self._names[vlan_id] is None:
+            self._count += 1
+        self._names[vlan_id] = name[:20]
+
+    def discard(self, vlan_id):
+        """
+        Quita una VLAN (si no existe, no hace nada).
+        """
+        vlan_id = int(vlan_id)
+        if 1 <= vlan_id <= MAX_VLAN_ID and self._names[vlan_id] is not None:
+            self._names[vlan_id] = None
+            self._count -= 1
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        for vlan_id, name in enumerate(self._names):
+            if name is not None:
+                yield {"id": str(vlan_id), "name": name}
+
+    def page(self, page, per_page=VLANS_PER_PAGE):
+        """
+        Devuelve solo las VLANs de la página pedida (empezando en 1).
+        """
+        start = (page - 1) * per_page
+        return list(itertools.islice(iter(self), start, start + per_page))
+
+    def ranges(self):
+        """
+        Recorre la tabla agrupando IDs consecutivos cuyo nombre sigue el mismo
+        patrón y devuelve tuplas (primer_id, último_id, plantilla), donde la
+        plantilla usa {id} y las llaves literales escapadas (ver expand_vlan_name):
+
+            (100, 199, "PREFIX_{id}")
+            (300, 300, "SERVERS")
+        """
+        vlan_id = 1
+        while vlan_id <= MAX_VLAN_ID:
+            name = self._names[vlan_id]
+            if name is None:
+                vlan_id += 1
+                continue
+
+            # Probamos "nombre con {id}" y "nombre fijo" y nos quedamos con el rango más largo
+            escaped = escape_vlan_name(name)
+            best_end, best_template = vlan_id, escaped
+            for template in (escaped.replace(str(vlan_id), "{id}"), escaped):
+                end = vlan_id
+                while (end < MAX_VLAN_ID
+                       and self._names[end + 1] is not None
+                       and self._names[end + 1] == expand_vlan_name(template, end + 1)):
+                    end += 1
+                if end > best_end:
+                    best_end, best_template = end, template
+
+            yield vlan_id, best_end, best_template
+            vlan_id = best_end + 1
+
+    def summary(self):
+        """
+        Resumen legible de la tabla, una línea por rango, con los nombres reales:
+
+            VLAN 100-199 - PREFIX_100 … PREFIX_199
+            VLAN 300 - SERVERS
+        """
+        lines = []
+        for first, last, template in self.ranges():
+            first_name = expand_vlan_name(template, first)
+            last_name = expand_vlan_name(template, last)
+            if first == last:
+                lines.append(f"VLAN {first} - {first_name}")
+            elif first_name == last_name:
+                lines.append(f"VLAN {first}-{last} - {first_name}")
+            else:
+                lines.append(f"VLAN {first}-{last} - {first_name} … {last_name}")
+        return lines
+
+
+def load_vlan_spec(vlans, text):
+    """
+    Carga en 'vlans' (VlanTable) las entradas de un texto en formato compacto,
+    una por línea:
+
+        10                  → VLAN 10 con nombre por defecto (VLAN_10)
+        20:USERS            → VLAN 20 con nombre USERS
+        100-199:PREFIX_{id} → VLANs 100 a 199, {id} se reemplaza por cada ID
+
+    Para una llave literal en el nombre se usa {{ o }}.
+
+    Devuelve la lista de líneas inválidas (que se ignoran).
+    """
+    invalid = []
+    # Solo \n separa líneas (splitlines también corta en \x85, \u2028, etc.)
+    for line in text.split("\n"):
+        line = line.strip()
+        if not line:
+            continue
+
+        ids, _, name = line.partition(":")
+        match = re.match(r"^(\d+)(?:\s*-\s*(\d+))?$", ids.strip())
+        if not match:
+            invalid.append(line)
+            continue
+
+        first = int(match.group(1))
+        last = int(match.group(2) or first)
+        if not 1 <= first <= last <= MAX_VLAN_ID:
+            invalid.append(line)
+            continue
+
+        for vlan_id in range(first, last + 1):
+            vlans.set(vlan_id, expand_vlan_name(name, vlan_id))
+
+    return invalid
+
+
+def load_vlan_csv(vlans, file_storage):
+    """
+    Carga en 'vlans' un CSV subido desde el formulario con columnas:
+
+        vlan_id,nombre
+
+    - La primera fila se saltea si es un encabezado (no empieza con dígito)
+    - La columna de ID acepta rangos y el nombre puede usar {id},
+      igual que en load_vlan_spec
+
+    Devuelve la lista de líneas inválidas (que se ignoran).
+    """
+    content = file_storage.read().decode("utf-8-sig", errors="replace")
+
+    lines = []
+    for row in csv.reader(io.StringIO(content)):
+        if not row or not row[0].strip():
+            continue
+        if not lines and not row[0].strip()[0].isdecimal():
+            continue  # encabezado
+        name = clean_vlan_name(row[1]) if len(row) > 1 else ""
+        lines.append(f"{row[0]}:{name}")
+
+    return load_vlan_spec(vlans, "\n".join(lines))
+
+
+def get_vlan_table():
+    """
+    Devuelve la VlanTable de esta sesión desde VLAN_STORE (la crea si no existe
+    o si se descartó). En la sesión de Flask solo se guarda el id.
+    """
+    table_id = session.get("vlan_table_id")
+    if table_id not in VLAN_STORE:
+        table_id = uuid.uuid4().hex
+        session["vlan_table_id"] = table_id
+        VLAN_STORE[table_id] = VlanTable()
+
+    return VLAN_STORE[table_id]
+
+
+def save_vlan_table(vlans):
+    """
+    Guarda la VlanTable de esta sesión en VLAN_STORE y descarta las sesiones
+    menos usadas si se pasa de VLAN_STORE_MAX.
+    """
+    table_id = session.get("vlan_table_id") or uuid.uuid4().hex
+    session["vlan_table_id"] = table_id
+
+    # La sacamos y la volvemos a poner para dejarla al final (la más reciente)
+    VLAN_STORE.pop(table_id, None)
+    VLAN_STORE[table_id] = vlans
+    while len(VLAN_STORE) > VLAN_STORE_MAX:
+        del VLAN_STORE[next(iter(VLAN_STORE))]
+
 
 ###############################################################################
 # FUNCIONES AUXILIARES DE NETMIKO / DISPOSITIVO
@@ -120,39 +391,6 @@ def apply_config(vlans, hostname, device_ip, username, password, port, protocol)
         return False, f"Error inesperado: {e}"
 
 
-def fetch_current_vlans(device_ip, username, password, port, protocol):
-    """
-    Ejecuta 'show vlan brief' y parsea la salida para obtener una lista
-    de VLANs en el formato:
-
-        [{"id": "10", "name": "USERS"}, ...]
-
-    Ignora las VLANs 1002–1005.
-    """
-    device = build_device(device_ip, username, password, port, protocol)
-
-    try:
-        conn = ConnectHandler(**device)
-
-        try:
-            conn.enable()
-        except Exception:
-            pass
-
-        output = conn.send_command("show vlan brief")
-        conn.disconnect()
-
-        vlans = parse_vlans_from_show(output)
-        return True, vlans, output
-
-    except NetmikoAuthenticationException as e:
-        return False, [], f"Error de autenticación: {e}"
-    except NetmikoTimeoutException as e:
-        return False, [], f"Timeout conectando al dispositivo: {e}"
-    except Exception as e:
-        return False, [], f"Error inesperado: {e}"
-
-
 def parse_vlans_from_show(output):
     """
     Parseo simple de la salida de 'show vlan brief'.
@@ -178,7 +416,7 @@ def parse_vlans_from_show(output):
         vlan_id = parts[0]
         vlan_name = parts[1]
 
-        if not vlan_id.isdigit():
+        if not vlan_id.isdecimal():
             continue
 
         if vlan_id in IGNORE_VLANS:
@@ -239,6 +477,154 @@ def parse_hostname_from_output(output):
     return ""
 
 
+def run_commands_pipelined(conn, commands, read_timeout=30):
+    """
+    Ejecuta varios comandos show en una sola ida al canal:
+
+    - Escribe todos los comandos juntos (el IOS los encola como type-ahead)
+    - Lee hasta ver el prompt una vez por comando
+    - Separa la salida usando el prompt como frontera entre comandos
+
+    Devuelve una lista de salidas (mismo orden que 'commands'), con el eco del
+    comando y el prompt ya quitados, igual que send_command.
+
+    Errores (para que quien llama haga fallback):
+
+    - ValueError: el equipo no respeta el type-ahead (eco que no coincide)
+    - TimeoutError: no llegaron todos los prompts dentro de read_timeout
+    """
+    prompt = conn.find_prompt()
+    conn.clear_buffer()
+
+    # 1) Mandamos todos los comandos de una vez
+    conn.write_channel("".join(cmd + conn.RETURN for cmd in commands))
+
+    # 2) Leemos hasta tener un prompt por cada comando enviado.
+    #    Sobre la salida cruda el fin de línea puede ser \r o \n, y solo se
+    #    revisa lo nuevo (scan_pos) para no recorrer todo el buffer en cada lectura.
+    raw_prompt_regex = re.compile(r"(?:^|(?<=[\r\n]))" + re.escape(prompt))
+    output = ""
+    pending = ""  # resto de un código ANSI que quedó partido entre lecturas
+    prompts_seen = 0
+    scan_pos = 0
+    deadline = time.monotonic() + read_timeout
+    while prompts_seen < len(commands):
+        if time.monotonic() > deadline:
+            raise TimeoutError("Timeout esperando los prompts del pipeline.")
+        chunk = conn.read_channel()
+        if not chunk:
+            time.sleep(0.05)
+            continue
+
+        # Sacamos los códigos ANSI antes de buscar prompts (pueden rodear al prompt).
+        # Si la lectura termina en medio de un código, lo guardamos para la próxima.
+        pending += chunk
+        cut = pending.rfind("\x1b")
+        if cut != -1 and len(pending) - cut < 16 and not re.search(r"[A-Za-z]", pending[cut + 1:]):
+            chunk, pending = pending[:cut], pending[cut:]
+        else:
+            chunk, pending = pending, ""
+        output += conn.strip_ansi_escape_codes(chunk)
+        for match in raw_prompt_regex.finditer(output, scan_pos):
+            prompts_seen += 1
+            scan_pos = match.end()
+        # Un prompt puede quedar partido entre dos lecturas: lo volvemos a revisar
+        scan_pos = max(scan_pos, len(output) - len(prompt))
+
+    # 3) Normalizamos una sola vez y demultiplexamos: cada bloque es
+    #    "<eco del comando>\n<salida>" (el prompt inicial ya se consumió
+    #    con find_prompt / clear_buffer)
+    output = conn.normalize_linefeeds(output)
+    prompt_regex = re.compile(r"^" + re.escape(prompt), flags=re.M)
+    blocks = prompt_regex.split(output)[:len(commands)]
+
+    results = []
+    for cmd, block in zip(commands, blocks):
+        block = conn.strip_ansi_escape_codes(block)
+        echo, _, body = block.partition("\n")
+        if echo.strip() != cmd:
+            raise ValueError(f"Eco inesperado en el pipeline: {echo.strip()!r}")
+        results.append(body.strip("\n"))
+
+    return results
+
+
+def open_connection(device):
+    """
+    Abre la conexión con Netmiko e intenta entrar a modo enable.
+    """
+    conn = ConnectHandler(**device)
+
+    try:
+        conn.enable()
+    except Exception:
+        pass
+
+    return conn
+
+
+def run_commands(device, commands, pipeline=True):
+    """
+    Ejecuta una lista de comandos show y devuelve (salidas, modo).
+
+    - Intenta primero el modo pipeline (run_commands_pipelined)
+    - Si el equipo no lo soporta (eco que no coincide), recuerda host/puerto en
+      PIPELINE_UNSUPPORTED y vuelve al modo secuencial clásico
+      (un send_command por comando)
+    - Si se venció el tiempo (enlace lento), lo recuerda en PIPELINE_TIMEOUTS
+      y usa secuencial durante PIPELINE_RETRY_SECONDS
+
+    En ambos fallbacks se abre una conexión nueva: los comandos del pipeline
+    pueden seguir corriendo y su salida mezclarse con la de send_command.
+    """
+    key = (device["host"], device["port"])
+
+    use_pipeline = (
+        pipeline
+        and key not in PIPELINE_UNSUPPORTED
+        and time.monotonic() - PIPELINE_TIMEOUTS.get(key, float("-inf")) > PIPELINE_RETRY_SECONDS
+    )
+
+    conn = open_connection(device)
+    try:
+        if use_pipeline:
+            try:
+                return run_commands_pipelined(conn, commands), "pipeline"
+            except ValueError:
+                PIPELINE_UNSUPPORTED.add(key)
+            except TimeoutError:
+                PIPELINE_TIMEOUTS[key] = time.monotonic()
+
+            conn.disconnect()
+            conn = open_connection(device)
+
+        return [conn.send_command(cmd) for cmd in commands], "secuencial"
+
+    finally:
+        conn.disconnect()
+
+
+def fetch_device_facts(device_ip, username, password, port, protocol):
+    """
+    Junta la información de FACT_COMMANDS (VLANs, hostname, versión e
+    interfaces) usando run_commands (una sola conexión si el pipeline anda).
+
+    Devuelve (ok, {comando: salida}, modo) o (False, {}, mensaje_de_error).
+    """
+    device = build_device(device_ip, username, password, port, protocol)
+
+    try:
+        outputs, mode = run_commands(device, FACT_COMMANDS)
+        return True, dict(zip(FACT_COMMANDS, outputs)), mode
+
+    except NetmikoAuthenticationException as e:
+        return False, {}, f"Error de autenticación: {e}"
+    except NetmikoTimeoutException as e:
+        return False, {}, f"Timeout conectando al dispositivo: {e}"
+    except Exception as e:
+        return False, {}, f"Error inesperado: {e}"
+
+
 def save_config_only(device_ip, username, password, port, protocol):
     """
     Llama a 'save_config()' de Netmiko, que normalmente ejecuta:
@@ -398,6 +784,8 @@ def index():
     - download_config → Descargar running-config como .txt
     - tftp_upload     → copy running-config tftp:
     - apply           → Aplicar VLANs + hostname
+    - load_vlans      → Cargar VLANs por rangos / CSV (solo en el formulario)
+    - paginate        → Cambiar de página en la tabla de VLANs (botones goto_page)
     """
 
     # Recuperamos valores "persistentes" desde la sesión (si existen)
@@ -410,7 +798,8 @@ def index():
     tftp_server = session.get("tftp_server", "")
 
     # Variables que se usan para renderizar el template
-    vlans = []
+    vlans = VlanTable()
+    vlan_page = 1
     error_msg = None
     success_msg = None
     netmiko_output = None
@@ -424,9 +813,17 @@ def index():
     # -------------------------------------------------------------------------
     if request.method == "POST":
         # Acción solicitada por el usuario (botón presionado)
-        # Valores posibles: apply, fetch_all, save_config, download_config, tftp_upload
+        # Valores posibles: apply, fetch_all, save_config, download_config, tftp_upload, load_vlans
         action = request.form.get("action", "apply")
 
+        # Los botones de paginado mandan goto_page en lugar de action
+        if request.form.get("goto_page"):
+            action = "paginate"
+            vlan_page = request.form.get("goto_page")
+        else:
+            vlan_page = request.form.get("vlan_page", "1")
+        vlan_page = int(vlan_page) if vlan_page.isdecimal() else 1
+
         # Leemos los campos que vienen del formulario
         form_ip = request.form.get("device_ip", "").strip()
         form_user = request.form.get("username", "").strip()
@@ -489,50 +886,65 @@ def index():
         password_for_field = password
 
         # ---------------------------------------------------------------------
-        # Parseamos las VLANs que vengan del formulario
+        # Reconstruimos las VLANs del formulario
         # (se usan cuando se presiona "Aplicar cambios en el dispositivo")
+        #
+        # 1) Todas las VLANs están guardadas en el servidor (get_vlan_table)
+        # 2) Se quitan las de la página visible (vlan_page_ids) y se vuelven a
+        #    cargar desde sus filas, así los cambios / borrados de la página
+        #    actual pisan lo que había
+        # 3) Se suman las cargas masivas: CSV subido y texto por rangos
         # ---------------------------------------------------------------------
+        vlans = get_vlan_table()
+        invalid_lines = []
+
+        for vid in request.form.get("vlan_page_ids", "").split(","):
+            if vid.strip().isdecimal():
+                vlans.discard(vid)
+
         vlan_ids = request.form.getlist("vlan_id")
         vlan_names = request.form.getlist("vlan_name")
 
         for vid, vname in zip(vlan_ids, vlan_names):
             vid = vid.strip()
-            vname = vname.strip()
-
             if not vid:
                 continue
-            if vid in IGNORE_VLANS:
-                # Por si alguien quiere meter a mano una VLAN 1002–1005, la ignoramos
+            if not vid.isdecimal() or not 1 <= int(vid) <= MAX_VLAN_ID:
+                # Antes llegaban al equipo, que daba el error: ahora lo avisamos acá
+                invalid_lines.append(f"{vid}:{vname.strip()}")
                 continue
-            if not vname:
-                vname = f"VLAN_{vid}"
+            # VlanTable.set ignora 1002–1005, pone nombre por defecto y corta a 20 caracteres
+            vlans.set(vid, vname)
 
-            # Regla: máximo 20 caracteres en el nombre de VLAN (seguridad backend)
-            if len(vname) > 20:
-                vname = vname[:20]
+        vlan_csv = request.files.get("vlan_csv")
+        if vlan_csv and vlan_csv.filename:
+            invalid_lines += load_vlan_csv(vlans, vlan_csv)
 
-            vlans.append({"id": vid, "name": vname})
+        invalid_lines += load_vlan_spec(vlans, request.form.get("vlan_bulk", ""))
+
+        if invalid_lines:
+            error_msg = "Líneas de VLAN inválidas (ignoradas): " + ", ".join(invalid_lines[:10])
 
         # ---------------------------------------------------------------------
         # Validación básica de conexión
         # ---------------------------------------------------------------------
         # Validación real de IP en backend
         ip_regex = r"^((25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$"
-        if not re.match(ip_regex, device_ip):
+        if action == "paginate":
+            # Solo cambia la página visible; no se toca el dispositivo
+            pass
+        elif action == "load_vlans":
+            # Las VLANs ya se cargaron arriba; solo se muestran en el formulario
+            if not invalid_lines:
+                success_msg = f"VLANs cargadas en el formulario: {len(vlans)}."
+        elif not re.match(ip_regex, device_ip):
             error_msg = "La IP del dispositivo no es válida."
         else:
             # -----------------------------------------------------------------
             # Acción: Leer VLANs + hostname (fetch_all)
             # -----------------------------------------------------------------
             if action == "fetch_all":
-                ok_vlans, vlans_from_device, out_vlans = fetch_current_vlans(
-                    device_ip=device_ip,
-                    username=username,
-                    password=password,
-                    port=port,
-                    protocol=protocol,
-                )
-                ok_host, hostname_from_device, out_host = fetch_hostname(
+                ok, facts, mode = fetch_device_facts(
                     device_ip=device_ip,
                     username=username,
                     password=password,
@@ -540,34 +952,26 @@ def index():
                     protocol=protocol,
                 )
 
-                msgs_ok = []
-                msgs_err = []
-
-                if ok_vlans:
-                    vlans = vlans_from_device
-                    msgs_ok.append("VLANs leídas correctamente.")
+                if not ok:
+                    # En este caso, mode contiene el mensaje de error
+                    error_msg = f"Error leyendo VLANs y hostname: {mode}"
                 else:
-                    msgs_err.append(f"Error leyendo VLANs: {vlans_from_device}")
+                    vlans = VlanTable(parse_vlans_from_show(facts["show vlan brief"]))
+                    vlan_page = 1
 
-                if ok_host:
+                    hostname_from_device = parse_hostname_from_output(
+                        facts["show running-config | include ^hostname"]
+                    )
                     if hostname_from_device:
                         hostname = hostname_from_device
                         session["hostname"] = hostname
-                    msgs_ok.append("Hostname leído correctamente.")
-                else:
-                    msgs_err.append(f"Error leyendo hostname: {hostname_from_device}")
 
-                if msgs_ok:
-                    success_msg = " ".join(msgs_ok)
-                if msgs_err:
-                    error_msg = " ".join(msgs_err)
+                    success_msg = f"VLANs y hostname leídos correctamente (modo {mode})."
 
-                # Construimos una salida combinada para mostrar en el textarea
-                netmiko_output = ""
-                if out_vlans:
-                    netmiko_output += "=== show vlan brief ===\n" + out_vlans
-                if out_host:
-                    netmiko_output += "\n\n=== hostname ===\n" + out_host
+                    # Construimos una salida combinada para mostrar en el textarea
+                    netmiko_output = "\n\n".join(
+                        f"=== {cmd} ===\n{out}" for cmd, out in facts.items()
+                    )
 
             # -----------------------------------------------------------------
             # Acción: Write memory (save_config)
@@ -651,7 +1055,10 @@ def index():
             # Acción por defecto: aplicar VLANs + hostname (apply)
             # -----------------------------------------------------------------
             else:  # action == "apply"
-                if len(vlans) == 0 and not hostname:
+                if invalid_lines:
+                    # No aplicamos un set de VLANs incompleto: primero hay que corregir las líneas
+                    error_msg += " No se aplicaron cambios en el dispositivo."
+                elif len(vlans) == 0 and not hostname:
                     error_msg = "No hay cambios para aplicar (ni VLANs ni hostname)."
                 else:
                     ok, output = apply_config(
@@ -671,10 +1078,24 @@ def index():
 
     # -------------------------------------------------------------------------
     # Renderizamos la plantilla con todos los datos recopilados
+    # (solo se dibujan las filas de la página actual de VLANs)
     # -------------------------------------------------------------------------
+    vlan_pages = max(1, -(-len(vlans) // VLANS_PER_PAGE))
+    vlan_page = min(max(vlan_page, 1), vlan_pages)
+
+    # Las VLANs quedan en el servidor; al template solo van la página actual
+    # y los primeros rangos del resumen
+    save_vlan_table(vlans)
+    vlan_summary = vlans.summary()
+
     return render_template(
         "index.html",
-        vlans=vlans,
+        vlans=vlans.page(vlan_page),
+        vlan_count=len(vlans),
+        vlan_page=vlan_page,
+        vlan_pages=vlan_pages,
+        vlan_summary=vlan_summary[:VLAN_SUMMARY_LINES],
+        vlan_summary_more=max(0, len(vlan_summary) - VLAN_SUMMARY_LINES),
         device_ip=device_ip,
         username=username,
         port=port,
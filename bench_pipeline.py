@@ -0,0 +1,74 @@
+"""
+bench_pipeline.py
+=================
+Benchmark simple: compara el tiempo de ejecutar FACT_COMMANDS en modo
+secuencial (un send_command por comando) contra el modo pipeline
+(run_commands_pipelined), sobre la misma conexión.
+
+Uso:
+
+    python bench_pipeline.py 10.20.20.1 admin cisco --port 5000 --protocol telnet -n 5
+"""
+
+import argparse
+import statistics
+import time
+
+from netmiko import ConnectHandler
+
+from app import FACT_COMMANDS, build_device, run_commands_pipelined
+
+
+def timed(func, repeat):
+    """
+    Ejecuta func() 'repeat' veces y devuelve la lista de tiempos (segundos).
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pipeline vs send_command secuencial")
+    parser.add_argument("device_ip")
+    parser.add_argument("username")
+    parser.add_argument("password")
+    parser.add_argument("--port", type=int, default=23)
+    parser.add_argument("--protocol", choices=["telnet", "ssh"], default="telnet")
+    parser.add_argument("-n", "--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    device = build_device(args.device_ip, args.username, args.password, args.port, args.protocol)
+    conn = ConnectHandler(**device)
+
+    try:
+        conn.enable()
+    except Exception:
+        pass
+
+    # Verificamos que ambos modos devuelvan lo mismo antes de medir
+    sequential = [conn.send_command(cmd) for cmd in FACT_COMMANDS]
+    pipelined = run_commands_pipelined(conn, FACT_COMMANDS)
+    for cmd, seq_out, pipe_out in zip(FACT_COMMANDS, sequential, pipelined):
+        if seq_out.strip() != pipe_out.strip():
+            print(f"AVISO: la salida de '{cmd}' difiere entre modos")
+
+    seq_times = timed(lambda: [conn.send_command(cmd) for cmd in FACT_COMMANDS], args.repeat)
+    pipe_times = timed(lambda: run_commands_pipelined(conn, FACT_COMMANDS), args.repeat)
+
+    conn.disconnect()
+
+    seq_median = statistics.median(seq_times)
+    pipe_median = statistics.median(pipe_times)
+
+    print(f"Comandos: {len(FACT_COMMANDS)} | repeticiones: {args.repeat}")
+    print(f"Secuencial (send_command): mediana {seq_median:.3f} s")
+    print(f"Pipeline:                  mediana {pipe_median:.3f} s")
+    print(f"Speedup:                   x{seq_median / pipe_median:.2f}")
+
+
+if __name__ == "__main__":
+    main()